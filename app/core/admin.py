@@ -1,13 +1,54 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
 from . import models
 from django.utils.translation import gettext
 
 
+class EstimatedCountPaginator(Paginator):
+
+    estimate_threshold = 10000
+
+    def get_estimate(self):
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE relname = %s',
+                [self.object_list.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    @cached_property
+    def count(self):
+        if not self.object_list.query.where:
+            estimate = self.get_estimate()
+            if estimate is not None and estimate > self.estimate_threshold:
+                return int(estimate)
+        return super().count
+
+
+class UserChangeList(ChangeList):
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            'id', 'email', 'name', 'is_staff', 'is_active'
+        )
+
+
 class CustomUserAdmin(UserAdmin):
     ordering = ['id']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ['email', 'name']
+    search_fields = ['email', 'name']
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
         (gettext('Personal Info'), {'fields': ('name',)}),
@@ -24,6 +65,9 @@ class CustomUserAdmin(UserAdmin):
         }),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return UserChangeList
+
 
 admin.site.register(models.User, CustomUserAdmin)
 admin.site.register(models.Tag)
@@ -48,6 +48,12 @@ class Tag(models.Model):
         on_delete=models.CASCADE,
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name'],
+                         name='core_tag_user_name_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -59,6 +65,12 @@ class Ingredient(models.Model):
         on_delete=models.CASCADE
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name'],
+                         name='core_ingredient_user_name_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
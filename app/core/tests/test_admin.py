@@ -1,35 +1,72 @@
-from django.test import TestCase, Client
+from unittest.mock import patch
+
+from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.db import connections
 from django.urls import reverse
 
+from core.admin import EstimatedCountPaginator
+
+USER_CHANGELIST_URL = reverse('admin:core_user_changelist')
+
 
 class AdminSiteTests(TestCase):
 
-    def setUp(self):
-        self.client = Client()
-        self.admin_user = get_user_model().objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = get_user_model().objects.create_superuser(
             'superuser@example.com', 'Qwerty123'
         )
-        self.client.force_login(self.admin_user)
-        self.user = get_user_model().objects.create_user(
+        cls.user = get_user_model().objects.create_user(
             'regularuser@example.com', 'Qwerty123', name='John'
         )
 
-    def test_users_listed(self):
-        url = reverse('admin:core_user_changelist')
-        response = self.client.get(url)
+    def setUp(self):
+        self.client.force_login(self.admin_user)
+
+    def test_admin_pages(self):
+        pages = (
+            ('admin:core_user_changelist', [],
+             [self.user.name, self.user.email]),
+            ('admin:core_user_change', [self.user.id], []),
+            ('admin:core_user_add', [], []),
+        )
+        for name, args, expected in pages:
+            with self.subTest(name=name):
+                response = self.client.get(reverse(name, args=args))
+
+                self.assertEqual(response.status_code, 200)
+                for text in expected:
+                    self.assertContains(response, text)
+
+    @patch.object(EstimatedCountPaginator, 'get_estimate',
+                  return_value=50000)
+    def test_changelist_uses_estimate_above_threshold(self, get_estimate):
+        response = self.client.get(USER_CHANGELIST_URL)
+
+        get_estimate.assert_called_once()
+        self.assertContains(response, '50000 users')
+
+    @patch.object(EstimatedCountPaginator, 'get_estimate', return_value=5)
+    def test_changelist_exact_count_below_threshold(self, get_estimate):
+        response = self.client.get(USER_CHANGELIST_URL)
 
-        self.assertContains(response, self.user.name)
-        self.assertContains(response, self.user.email)
+        get_estimate.assert_called_once()
+        self.assertContains(response, '2 users')
 
-    def test_user_change_page(self):
-        url = reverse('admin:core_user_change', args=[self.user.id])
-        response = self.client.get(url)
+    @patch.object(EstimatedCountPaginator, 'get_estimate',
+                  return_value=50000)
+    def test_filtered_changelist_exact_count(self, get_estimate):
+        response = self.client.get(USER_CHANGELIST_URL,
+                                   {'q': self.user.email})
 
-        self.assertEqual(response.status_code, 200)
+        get_estimate.assert_not_called()
+        self.assertContains(response, '1 user')
 
-    def test_user_create_page(self):
-        url = reverse('admin:core_user_add')
-        response = self.client.get(url)
+    def test_estimate_skipped_on_other_backends(self):
+        queryset = get_user_model().objects.order_by('id')
+        paginator = EstimatedCountPaginator(queryset, 100)
 
-        self.assertEqual(response.status_code, 200)
+        with patch.object(connections[queryset.db], 'vendor', 'sqlite'):
+            self.assertIsNone(paginator.get_estimate())
+            self.assertEqual(paginator.count, 2)
@@ -38,6 +38,23 @@ class RecipeSerializer(serializers.ModelSerializer):
         read_only_fields = ('id',)
 
 
+class RecipeListSerializer(serializers.ModelSerializer):
+
+    ingredients = serializers.PrimaryKeyRelatedField(
+        many=True, read_only=True
+    )
+    tags = serializers.PrimaryKeyRelatedField(
+        many=True, read_only=True
+    )
+
+    class Meta:
+
+        model = Recipe
+        fields = ('id', 'title', 'time_minutes', 'price', 'link',
+                  'tags', 'ingredients')
+        read_only_fields = fields
+
+
 class RecipeDetailSerializer(RecipeSerializer):
 
     ingredients = IngredientSerializer(many=True, read_only=True)
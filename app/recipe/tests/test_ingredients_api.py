@@ -1,5 +1,5 @@
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.urls import reverse_lazy
 from django.test import TestCase
 
 from rest_framework import status
@@ -8,13 +8,12 @@ from rest_framework.test import APIClient
 from core.models import Ingredient, Recipe
 from recipe.serializers import IngredientSerializer
 
-INGREDIENTS_URL = reverse('recipe:ingredient-list')
+INGREDIENTS_URL = reverse_lazy('recipe:ingredient-list')
 
 
 class PublicIngredientsApiTests(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_login_required(self):
         response = self.client.get(INGREDIENTS_URL)
@@ -23,25 +22,30 @@ class PublicIngredientsApiTests(TestCase):
 
 class PrivateIngredientsApiTests(TestCase):
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test@example.com',
             password='Qwerty123',
             name='John'
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredient_list(self):
         Ingredient.objects.create(user=self.user, name='Cucumber')
         Ingredient.objects.create(user=self.user, name='Potato')
 
-        response = self.client.get(INGREDIENTS_URL)
+        with self.assertNumQueries(1):
+            response = self.client.get(INGREDIENTS_URL)
         ingredients = Ingredient.objects.all().order_by('-name')
         serializer = IngredientSerializer(ingredients, many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data['results'], serializer.data)
 
     def test_ingredients_limited_to_user(self):
         user2 = get_user_model().objects.create_user(
@@ -55,8 +59,8 @@ class PrivateIngredientsApiTests(TestCase):
                                   name='Garlic')
         response = self.client.get(INGREDIENTS_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['name'], ingredient.name)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['name'], ingredient.name)
 
     def test_create_ingredient_successful(self):
         payload = {'name': 'Herring'}
@@ -89,26 +93,21 @@ class PrivateIngredientsApiTests(TestCase):
         serializer1 = IngredientSerializer(ingredient1)
         serializer2 = IngredientSerializer(ingredient2)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn(serializer1.data, response.data)
-        self.assertNotIn(serializer2.data, response.data)
+        self.assertIn(serializer1.data, response.data['results'])
+        self.assertNotIn(serializer2.data, response.data['results'])
 
     def test_retrieve_ingredients_assigned_unique(self):
-        ingredient = Ingredient.objects.create(user=self.user, name='Butter')
-        Ingredient.objects.create(user=self.user, name='Bread')
-        recipe1 = Recipe.objects.create(
-            user=self.user,
-            title='Fried eggs',
-            time_minutes=3,
-            price=1.00
-        )
-        recipe2 = Recipe.objects.create(
-            user=self.user,
-            title='Chicken curry',
-            time_minutes=40,
-            price=12.00
-        )
-        recipe1.ingredients.add(ingredient)
-        recipe2.ingredients.add(ingredient)
+        ingredient, _ = Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Butter'),
+            Ingredient(user=self.user, name='Bread'),
+        ])
+        recipes = Recipe.objects.bulk_create([
+            Recipe(user=self.user, title='Fried eggs',
+                   time_minutes=3, price=1.00),
+            Recipe(user=self.user, title='Chicken curry',
+                   time_minutes=40, price=12.00),
+        ])
+        ingredient.recipe_set.add(*recipes)
         response = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
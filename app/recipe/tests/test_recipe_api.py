@@ -1,10 +1,12 @@
+import io
 import os
+import shutil
 import tempfile
 
 from PIL import Image
 from django.contrib.auth import get_user_model
-from django.urls import reverse
-from django.test import TestCase
+from django.urls import reverse, reverse_lazy
+from django.test import TestCase, override_settings
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -12,7 +14,7 @@ from rest_framework.test import APIClient
 from core.models import Recipe, Tag, Ingredient
 from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
 
-RECIPE_URL = reverse('recipe:recipe-list')
+RECIPE_URL = reverse_lazy('recipe:recipe-list')
 
 
 def image_upload_url(recipe_id):
@@ -33,6 +35,13 @@ def sample_recipe(user, **params):
     return Recipe.objects.create(user=user, **defaults)
 
 
+def sample_recipes(user, *titles):
+    return Recipe.objects.bulk_create([
+        Recipe(user=user, title=title, time_minutes=30, price=7.99)
+        for title in titles
+    ])
+
+
 def sample_tag(user, name='Sample tag'):
     return Tag.objects.create(user=user, name=name)
 
@@ -43,8 +52,7 @@ def sample_ingredient(user, name='Cinnamon'):
 
 class PublicRecipeApiTests(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_login_required(self):
         response = self.client.get(RECIPE_URL)
@@ -53,13 +61,17 @@ class PublicRecipeApiTests(TestCase):
 
 class PrivateRecipeApiTests(TestCase):
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test@example.com',
             password='Qwerty123',
             name='John'
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes(self):
@@ -70,12 +82,13 @@ class PrivateRecipeApiTests(TestCase):
                       price=8.30,
                       )
 
-        response = self.client.get(RECIPE_URL)
+        with self.assertNumQueries(3):
+            response = self.client.get(RECIPE_URL)
         recipe_list = Recipe.objects.all().order_by('-id')
         serializer = RecipeSerializer(recipe_list, many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data['results'], serializer.data)
 
     def test_recipes_limited_to_user(self):
         user2 = get_user_model().objects.create_user(
@@ -91,20 +104,39 @@ class PrivateRecipeApiTests(TestCase):
                       )
         response = self.client.get(RECIPE_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], recipe.title)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], recipe.title)
 
     def test_view_recipe_detail(self):
         recipe = sample_recipe(user=self.user)
         recipe.tags.add(sample_tag(user=self.user))
         recipe.ingredients.add(sample_ingredient(user=self.user))
 
-        response = self.client.get(detail_url(recipe.id))
+        with self.assertNumQueries(3):
+            response = self.client.get(detail_url(recipe.id))
         serializer = RecipeDetailSerializer(recipe)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, serializer.data)
 
+    def test_view_other_users_recipe_not_found(self):
+        user2 = get_user_model().objects.create_user(
+            name='Test',
+            email='testanother@example.com',
+            password='passpass1234'
+        )
+        recipe = sample_recipe(user=user2)
+
+        response = self.client.get(detail_url(recipe.id))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_view_recipe_detail_ignores_list_filters(self):
+        recipe = sample_recipe(user=self.user)
+
+        response = self.client.get(detail_url(recipe.id), {'tags': 999})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], recipe.id)
+
     def test_create_recipe_successful(self):
         payload = {
             'title': 'Borsch',
@@ -179,30 +211,55 @@ class PrivateRecipeApiTests(TestCase):
 
 class RecipeImageUploadTests(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpClass(cls):
+        # Keep uploads out of the real media root, on tmpfs where available.
+        cls.media_root = tempfile.mkdtemp(
+            dir='/dev/shm' if os.path.isdir('/dev/shm') else None
+        )
+        cls.media_override = override_settings(MEDIA_ROOT=cls.media_root)
+        cls.media_override.enable()
+        try:
+            super().setUpClass()
+        except Exception:
+            cls.media_override.disable()
+            shutil.rmtree(cls.media_root, ignore_errors=True)
+            raise
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test@example',
             password='Qwerty123',
             name='John'
         )
+        image = io.BytesIO()
+        Image.new('RGB', (10, 10)).save(image, 'JPEG')
+        cls.image_bytes = image.getvalue()
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
         self.recipe = sample_recipe(user=self.user)
 
-    def tearDown(self):
-        self.recipe.image.delete()
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.media_override.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
 
     def test_upload_image_to_recipe(self):
         url = image_upload_url(self.recipe.id)
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as file:
-            img = Image.new('RGB', (10, 10))
-            img.save(file, 'JPEG')
-            file.seek(0)
-            response = self.client.post(url, {'image': file},
-                                        format='multipart')
+        image = io.BytesIO(self.image_bytes)
+        image.name = 'test.jpg'
+        response = self.client.post(url, {'image': image},
+                                    format='multipart')
         self.recipe.refresh_from_db()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('image', response.data)
+        self.assertEqual(response.data['image'],
+                         f'http://testserver{self.recipe.image.url}')
         self.assertTrue(os.path.exists(self.recipe.image.path))
 
     def test_upload_image_bad_request(self):
@@ -212,13 +269,18 @@ class RecipeImageUploadTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_filter_recipes_by_tags(self):
-        recipe1 = sample_recipe(user=self.user, title='Thai vegetable curry')
-        recipe2 = sample_recipe(user=self.user, title='Aubergine with tahini')
-        recipe3 = sample_recipe(user=self.user, title='Fish and Chips')
-        tag1 = sample_tag(user=self.user, name='Vegan')
-        tag2 = sample_tag(user=self.user, name='Vegetarian')
-        recipe1.tags.add(tag1)
-        recipe2.tags.add(tag2)
+        recipe1, recipe2, recipe3 = sample_recipes(
+            self.user, 'Thai vegetable curry', 'Aubergine with tahini',
+            'Fish and Chips'
+        )
+        tag1, tag2 = Tag.objects.bulk_create([
+            Tag(user=self.user, name='Vegan'),
+            Tag(user=self.user, name='Vegetarian'),
+        ])
+        Recipe.tags.through.objects.bulk_create([
+            Recipe.tags.through(recipe=recipe1, tag=tag1),
+            Recipe.tags.through(recipe=recipe2, tag=tag2),
+        ])
 
         response = self.client.get(
             RECIPE_URL,
@@ -229,18 +291,25 @@ class RecipeImageUploadTests(TestCase):
         serializer3 = RecipeSerializer(recipe3)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn(serializer1.data, response.data)
-        self.assertIn(serializer2.data, response.data)
-        self.assertNotIn(serializer3.data, response.data)
+        self.assertIn(serializer1.data, response.data['results'])
+        self.assertIn(serializer2.data, response.data['results'])
+        self.assertNotIn(serializer3.data, response.data['results'])
 
     def test_filter_recipes_by_ingredients(self):
-        recipe1 = sample_recipe(user=self.user, title='Thai vegetable curry')
-        recipe2 = sample_recipe(user=self.user, title='Aubergine with tahini')
-        recipe3 = sample_recipe(user=self.user, title='Fish and Chips')
-        ingredient1 = sample_ingredient(user=self.user, name='Cabbage')
-        ingredient2 = sample_ingredient(user=self.user, name='Salt')
-        recipe1.ingredients.add(ingredient1)
-        recipe2.ingredients.add(ingredient2)
+        recipe1, recipe2, recipe3 = sample_recipes(
+            self.user, 'Thai vegetable curry', 'Aubergine with tahini',
+            'Fish and Chips'
+        )
+        ingredient1, ingredient2 = Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Cabbage'),
+            Ingredient(user=self.user, name='Salt'),
+        ])
+        Recipe.ingredients.through.objects.bulk_create([
+            Recipe.ingredients.through(recipe=recipe1,
+                                       ingredient=ingredient1),
+            Recipe.ingredients.through(recipe=recipe2,
+                                       ingredient=ingredient2),
+        ])
 
         response = self.client.get(
             RECIPE_URL,
@@ -251,6 +320,23 @@ class RecipeImageUploadTests(TestCase):
         serializer3 = RecipeSerializer(recipe3)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn(serializer1.data, response.data)
-        self.assertIn(serializer2.data, response.data)
-        self.assertNotIn(serializer3.data, response.data)
+        self.assertIn(serializer1.data, response.data['results'])
+        self.assertIn(serializer2.data, response.data['results'])
+        self.assertNotIn(serializer3.data, response.data['results'])
+
+    def test_filter_recipes_ignores_empty_ids(self):
+        recipe1, recipe2 = sample_recipes(
+            self.user, 'Thai vegetable curry', 'Fish and Chips'
+        )
+        tag = sample_tag(user=self.user, name='Vegan')
+        recipe1.tags.add(tag)
+        serializer1 = RecipeSerializer(recipe1)
+        serializer2 = RecipeSerializer(recipe2)
+
+        for tags in (f'{tag.id},', f',{tag.id}'):
+            with self.subTest(tags=tags):
+                response = self.client.get(RECIPE_URL, {'tags': tags})
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertIn(serializer1.data, response.data['results'])
+                self.assertNotIn(serializer2.data, response.data['results'])
@@ -1,5 +1,5 @@
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.urls import reverse_lazy
 from django.test import TestCase
 
 from rest_framework import status
@@ -8,13 +8,12 @@ from rest_framework.test import APIClient
 from core.models import Tag, Recipe
 from recipe.serializers import TagSerializer
 
-TAGS_URL = reverse('recipe:tag-list')
+TAGS_URL = reverse_lazy('recipe:tag-list')
 
 
 class PublicTagApiTests(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_login_required(self):
         response = self.client.get(TAGS_URL)
@@ -24,25 +23,30 @@ class PublicTagApiTests(TestCase):
 
 class PrivateTagApiTests(TestCase):
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test@example.com',
             password='Qwerty123',
             name='John'
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
         Tag.objects.create(user=self.user, name='Vegan')
         Tag.objects.create(user=self.user, name='Dessert')
 
-        response = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1):
+            response = self.client.get(TAGS_URL)
 
         tags = Tag.objects.all().order_by('-name')
         serializer = TagSerializer(tags, many=True)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data['results'], serializer.data)
 
     def test_tags_limited_to_user(self):
         user2 = get_user_model().objects.create_user(
@@ -55,8 +59,8 @@ class PrivateTagApiTests(TestCase):
 
         response = self.client.get(TAGS_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['name'], tag.name)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['name'], tag.name)
 
     def test_create_tags_successful(self):
         payload = {'name': 'Vegan'}
@@ -89,26 +93,43 @@ class PrivateTagApiTests(TestCase):
         serializer1 = TagSerializer(tag1)
         serializer2 = TagSerializer(tag2)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn(serializer1.data, response.data)
-        self.assertNotIn(serializer2.data, response.data)
+        self.assertIn(serializer1.data, response.data['results'])
+        self.assertNotIn(serializer2.data, response.data['results'])
 
     def test_retrieve_tags_assigned_unique(self):
-        tag = Tag.objects.create(user=self.user, name='Breakfast')
-        Tag.objects.create(user=self.user, name='Lunch')
-        recipe1 = Recipe.objects.create(
-            user=self.user,
-            title='Fried eggs',
-            time_minutes=3,
-            price=1.00
-        )
-        recipe2 = Recipe.objects.create(
-            user=self.user,
-            title='Chicken curry',
-            time_minutes=40,
-            price=12.00
-        )
-        recipe1.tags.add(tag)
-        recipe2.tags.add(tag)
+        tag, _ = Tag.objects.bulk_create([
+            Tag(user=self.user, name='Breakfast'),
+            Tag(user=self.user, name='Lunch'),
+        ])
+        recipes = Recipe.objects.bulk_create([
+            Recipe(user=self.user, title='Fried eggs',
+                   time_minutes=3, price=1.00),
+            Recipe(user=self.user, title='Chicken curry',
+                   time_minutes=40, price=12.00),
+        ])
+        tag.recipe_set.add(*recipes)
         response = self.client.get(TAGS_URL, {'assigned_only': 1})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_filter_assigned_only_invalid_value(self):
+        tag = Tag.objects.create(user=self.user, name='Breakfast')
+
+        response = self.client.get(TAGS_URL, {'assigned_only': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['name'], tag.name)
+
+    def test_tags_paginated_without_count(self):
+        Tag.objects.create(user=self.user, name='Vegan')
+        Tag.objects.create(user=self.user, name='Dessert')
+
+        response = self.client.get(TAGS_URL, {'limit': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNotNone(response.data['next'])
+
+        response = self.client.get(TAGS_URL, {'limit': 1, 'offset': 1})
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNone(response.data['next'])
@@ -1,10 +1,13 @@
+from django.db.models import Exists, OuterRef
 from rest_framework import viewsets, mixins, status
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from . import serializers
+from .pagination import NameListPagination, RecipePagination
 from core.models import Tag, Ingredient, Recipe
 
 
@@ -13,14 +16,20 @@ class BaseViewSet(viewsets.GenericViewSet, mixins.ListModelMixin,
 
     authentication_classes = (TokenAuthentication,)
     permission_classes = (IsAuthenticated,)
+    pagination_class = NameListPagination
+    recipe_field = None
 
     def get_queryset(self):
         queryset = self.queryset
-        if bool(int(self.request.query_params.get('assigned_only', 0))):
-            queryset = queryset.filter(recipe__isnull=False)
+        assigned_only = self.request.query_params.get('assigned_only') in \
+            ('1', 'true', 'True')
+        if assigned_only:
+            queryset = queryset.filter(Exists(Recipe.objects.filter(
+                **{self.recipe_field: OuterRef('pk')}
+            )))
 
         return queryset.filter(user=self.request.user).\
-            order_by('-name').distinct()
+            only('id', 'name', 'user').order_by('-name')
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -30,12 +39,14 @@ class TagViewSet(BaseViewSet):
 
     queryset = Tag.objects.all()
     serializer_class = serializers.TagSerializer
+    recipe_field = 'tags'
 
 
 class IngredientViewSet(BaseViewSet):
 
     queryset = Ingredient.objects.all()
     serializer_class = serializers.IngredientSerializer
+    recipe_field = 'ingredients'
 
 
 class RecipeViewSet(viewsets.ModelViewSet):
@@ -44,25 +55,44 @@ class RecipeViewSet(viewsets.ModelViewSet):
     serializer_class = serializers.RecipeSerializer
     authentication_classes = (TokenAuthentication,)
     permission_classes = (IsAuthenticated,)
+    pagination_class = RecipePagination
 
     def _params_to_ints(self, qs):
-        return [int(i) for i in qs.split(',')]
+        return [int(i) for i in qs.split(',') if i]
 
     def get_queryset(self):
         tags = self.request.query_params.get('tags')
         ingredients = self.request.query_params.get('ingredients')
         queryset = self.queryset
+        filters = {}
         if tags:
-            tags_id = self._params_to_ints(tags)
-            queryset = queryset.filter(tags__id__in=tags_id)
+            filters['tags__id__in'] = self._params_to_ints(tags)
         if ingredients:
-            ingredients_id = self._params_to_ints(ingredients)
-            queryset = queryset.filter(ingredients__id__in=ingredients_id)
+            filters['ingredients__id__in'] = self._params_to_ints(ingredients)
+        if filters:
+            queryset = queryset.filter(**filters)
+        if self.action == 'list':
+            queryset = queryset.prefetch_related('tags', 'ingredients').\
+                only('id', 'title', 'time_minutes', 'price', 'link')
 
         return queryset.filter(user=self.request.user)
 
-    def get_serializer_class(self):
+    def get_object(self):
+        queryset = self.queryset.filter(user=self.request.user)
         if self.action == 'retrieve':
+            queryset = queryset.prefetch_related('tags', 'ingredients')
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        recipe = get_object_or_404(
+            queryset, **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        self.check_object_permissions(self.request, recipe)
+        return recipe
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return serializers.RecipeListSerializer
+        elif self.action == 'retrieve':
             return serializers.RecipeDetailSerializer
         elif self.action == 'upload_image':
             return serializers.RecipeImageSerializer
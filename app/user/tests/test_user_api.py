@@ -1,13 +1,13 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.urls import reverse_lazy
 
 from rest_framework.test import APIClient
 from rest_framework import status
 
-CREATE_USER_URL = reverse('user:create')
-TOKEN_URL = reverse('user:token')
-ME_URL = reverse('user:me')
+CREATE_USER_URL = reverse_lazy('user:create')
+TOKEN_URL = reverse_lazy('user:token')
+ME_URL = reverse_lazy('user:me')
 
 
 def create_user(**params):
@@ -16,8 +16,7 @@ def create_user(**params):
 
 class PublicUserApiTests(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_create_valid_user_success(self):
         payload = {
@@ -96,13 +95,17 @@ class PublicUserApiTests(TestCase):
 
 class PrivateUserApiTests(TestCase):
 
-    def setUp(self):
-        self.user = create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='test@example.com',
             password='Qwerty123',
             name='John'
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_profile_success(self):